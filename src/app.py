@@ -7,49 +7,278 @@ Docker GUI 操作工具
 
 import subprocess
 import logging
+import logging.handlers
+import atexit
+import concurrent.futures
+import codecs
+import collections
+import functools
 import os
+import queue
+import shlex
+import shutil
+import threading
+import time
 from datetime import datetime
-from tkinter import messagebox, simpledialog, ttk
-import tkinter as tk
-import webbrowser
-from config import load_config, save_config
-import argparse
+from config import load_config, save_config, json_loads
 
-# 日志配置
+# GUI 相关模块在 _load_gui() 中按需导入，命令行模式不加载 Tk
+tk = ttk = messagebox = simpledialog = None
+TextEditor = ProgressWindow = PushDialog = LogWindow = StatusBar = None
+log_font = LOG_TEXT_COLORS = None
+
+def _load_gui():
+    """导入 tkinter 及界面组件，只在首次调用时执行"""
+    global tk, ttk, messagebox, simpledialog, TextEditor, ProgressWindow, PushDialog, LogWindow, StatusBar
+    global log_font, LOG_TEXT_COLORS
+    if tk is not None:
+        return
+    import tkinter as tk
+    from tkinter import messagebox, simpledialog, ttk
+    from widgets import TextEditor, ProgressWindow, PushDialog, LogWindow, StatusBar
+    from widgets import log_font, LOG_TEXT_COLORS
+
+# 日志配置：日志记录先放入队列，由后台线程写入文件
+LOG_FILE = f'docker_gui_{datetime.now().strftime("%Y%m%d")}.log'
+LOG_OUTPUT_LIMIT = 200  # 命令输出只记录前200个字符
+_log_queue = queue.Queue(-1)
+_log_file_handler = logging.FileHandler(LOG_FILE, encoding='utf-8')
+_log_file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_file_handler)
 logging.basicConfig(
-    filename=f'docker_gui_{datetime.now().strftime("%Y%m%d")}.log',
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
+    format='%(message)s',  # 时间等字段由写文件的后台线程格式化
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
 )
+_log_listener.start()
+atexit.register(_log_listener.stop)
 
-def run_command(command, status_bar=None, task_name=None):
-    """执行 shell 命令并返回输出或错误信息"""
-    try:
-        logging.info(f"执行命令: {command}")
-        if status_bar and task_name:
-            status_bar.set_status(task_name, is_task=True)
-        
-        result = subprocess.run(
-            command, 
-            shell=True, 
-            check=True, 
-            stdout=subprocess.PIPE, 
-            stderr=subprocess.PIPE,
-            encoding='utf-8',
-            errors='replace'
+def _decode(data):
+    """命令输出统一按字节读取，需要文本时再一次性解码"""
+    return data.decode('utf-8', errors='replace')
+
+class DockerSession:
+    """常驻 shell 会话，只读的 docker 查询命令通过管道发送，省去每次启动 shell 的开销"""
+    TIMEOUT = 30  # 秒，单条命令超时后结束会话，避免一直占用锁
+    
+    def __init__(self, shell='sh', timeout=TIMEOUT):
+        self.shell = shell
+        self.timeout = timeout
+        self._proc = None
+        self._lines = None
+        self._counter = 0
+        self._lock = threading.Lock()
+    
+    def _start(self):
+        self._proc = subprocess.Popen(
+            [self.shell],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT
         )
-        output = result.stdout
-        logging.info(f"命令执行成功: {output}")
-        
-        if status_bar and task_name:
-            status_bar.task_complete(task_name, success=True)
-        return output
+        # 每个会话进程有自己的读取线程和队列，旧进程残留的输出不会混入新会话
+        self._lines = queue.Queue()
+        threading.Thread(target=self._read_lines, args=(self._proc.stdout, self._lines),
+                         daemon=True).start()
+    
+    @staticmethod
+    def _read_lines(stdout, lines):
+        for line in stdout:
+            lines.put(line)
+        lines.put(None)
+    
+    def _kill(self):
+        try:
+            self._proc.kill()
+        except OSError:
+            pass
+        self._proc = None
+    
+    def run(self, command):
+        """执行命令并返回 (退出码, 输出字节)，stderr 合并到输出中"""
+        with self._lock:
+            if self._proc is None or self._proc.poll() is not None:
+                self._start()
+            self._counter += 1
+            sentinel = f"__END_{self._counter}__".encode()
+            # 输出后补一个换行再打印结束标记，保证标记独占一行
+            self._proc.stdin.write(
+                f"{{ {command}\n}} </dev/null 2>&1; printf '\\n%s %d\\n' {sentinel.decode()} $?\n".encode()
+            )
+            self._proc.stdin.flush()
+            
+            deadline = time.monotonic() + self.timeout
+            lines = []
+            while True:
+                try:
+                    line = self._lines.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    self._kill()
+                    raise TimeoutError(f"命令执行超时({self.timeout}秒): {command}")
+                if line is None:
+                    self._proc = None
+                    raise RuntimeError("docker会话意外退出")
+                if line.startswith(sentinel):
+                    return int(line.split()[1]), b''.join(lines)[:-1]
+                lines.append(line)
+
+# 只读的本地查询命令走常驻会话；docker search 需要访问远程仓库，可能很慢，
+# 和构建、登录等命令一样单独启动进程，不占用列表刷新所用的会话
+SESSION_COMMANDS = (('docker', 'ps'), ('docker', 'images'))
+_docker_session = DockerSession() if os.name != 'nt' else None
+
+def execute_command(argv):
+    """执行命令（参数列表，不经过 shell），返回输出已解码的 CompletedProcess，成功与否看 returncode"""
+    logging.info(f"执行命令: {shlex.join(argv)}")
+    try:
+        if _docker_session and tuple(argv[:2]) in SESSION_COMMANDS:
+            returncode, output = _docker_session.run(shlex.join(argv))
+            # 会话中 stderr 已合并到输出里
+            result = subprocess.CompletedProcess(argv, returncode, output, output if returncode else b'')
+        else:
+            result = subprocess.run(argv, capture_output=True)
+    except Exception as e:
+        logging.error(f"错误: {str(e)}")
+        return subprocess.CompletedProcess(argv, -1, '', str(e))
+    
+    result.stdout = _decode(result.stdout)
+    result.stderr = _decode(result.stderr)
+    if result.returncode == 0:
+        logging.info(f"命令执行成功: {result.stdout[:LOG_OUTPUT_LIMIT]}")
+    else:
+        logging.error(f"命令执行失败({result.returncode}): {result.stderr[:LOG_OUTPUT_LIMIT]}")
+    return result
+
+STREAM_TAIL_LINES = 50
+
+def run_command_stream(argv, on_line, env=None):
+    """逐行执行命令并对每行输出调用 on_line(line)，只保留最后几行用于错误提示，内存占用与输出长度无关"""
+    logging.info(f"执行命令: {shlex.join(argv)}")
+    tail = collections.deque(maxlen=STREAM_TAIL_LINES)
+    try:
+        with subprocess.Popen(argv, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                              bufsize=1, text=True, encoding='utf-8', errors='replace',
+                              env=env) as proc:
+            for line in proc.stdout:
+                line = line.rstrip()
+                if line:
+                    tail.append(line)
+                    on_line(line)
+            returncode = proc.wait()
+    except Exception as e:
+        logging.error(f"错误: {str(e)}")
+        return subprocess.CompletedProcess(argv, -1, '', str(e))
+    
+    output = "\n".join(tail)
+    if returncode == 0:
+        logging.info(f"命令执行成功: {output[-LOG_OUTPUT_LIMIT:]}")
+        return subprocess.CompletedProcess(argv, returncode, output, '')
+    logging.error(f"命令执行失败({returncode}): {output[-LOG_OUTPUT_LIMIT:]}")
+    return subprocess.CompletedProcess(argv, returncode, '', output)
+
+def run_command(argv, status_bar=None, task_name=None):
+    """执行命令并返回输出或错误信息"""
+    if status_bar and task_name:
+        status_bar.set_status(task_name, is_task=True)
+    
+    result = execute_command(argv)
+    success = result.returncode == 0
+    
+    if status_bar and task_name:
+        status_bar.task_complete(task_name, success=success)
+    if success:
+        return result.stdout
+    return error_text(result)
+
+def error_text(result):
+    """把执行失败的 CompletedProcess 转换为 run_command 返回的错误信息"""
+    if result.returncode < 0 and not result.stdout:
+        # 命令未能启动
+        return f"错误: {result.stderr}"
+    return f"错误: {str(subprocess.CalledProcessError(result.returncode, result.args))}"
+
+# 列表查询命令在模块加载时构造一次，轮询时直接复用
+PS_CMD = ('docker', 'ps', '-a', '--format', '{{json .}}')
+IMG_CMD = ('docker', 'images', '--format', '{{json .}}')
+STATE_SEPARATOR = '__STATE_SEP__'
+STATE_SCRIPT = f"{shlex.join(PS_CMD)} && echo {STATE_SEPARATOR} && {shlex.join(IMG_CMD)}"
+STATE_SEPARATOR_LINE = f"{STATE_SEPARATOR}\n"
+
+def fetch_state():
+    """一次往返同时获取容器和镜像列表，返回 (容器输出, 镜像输出)"""
+    if _docker_session is None:
+        # 没有常驻会话时分别执行
+        return run_command(PS_CMD), run_command(IMG_CMD)
+    
+    script = STATE_SCRIPT
+    try:
+        logging.info(f"执行命令: {script}")
+        returncode, output = _docker_session.run(script)
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, script, output)
+        output = _decode(output)
+        logging.info(f"命令执行成功: {output[:LOG_OUTPUT_LIMIT]}")
     except Exception as e:
         error_msg = f"错误: {str(e)}"
         logging.error(error_msg)
+        return error_msg, error_msg
+    
+    containers, _, images = output.partition(STATE_SEPARATOR_LINE)
+    return containers, images
+
+# docker search 结果缓存：{查询命令参数: (查询时间, 输出)}
+SEARCH_CACHE_TTL = 600
+_search_cache = {}
+
+def cached_search(query, fmt=None, ttl=SEARCH_CACHE_TTL, refresh=False):
+    """执行 docker search，相同查询在 ttl 秒内直接返回缓存结果；refresh=True 时强制重新查询"""
+    argv = ('docker', 'search', query)
+    if fmt:
+        argv += ('--format', fmt)
+    
+    cached = _search_cache.get(argv)
+    if not refresh and cached and time.monotonic() - cached[0] < ttl:
+        return cached[1]
+    
+    result = execute_command(list(argv))
+    if result.returncode != 0:
+        return error_text(result)
+    _search_cache[argv] = (time.monotonic(), result.stdout)
+    return result.stdout
+
+# 后台线程池：docker 命令可并发执行，结果通过 root.after 交回 Tk 主线程
+_pool = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+
+def _deliver_result(future, on_done):
+    """任务完成后把结果交回主线程"""
+    try:
+        result = future.result()
+    except Exception as e:
+        logging.error(f"后台任务执行失败: {str(e)}")
+        result = f"错误: {str(e)}"
+    try:
+        root.after(0, on_done, result)
+    except (RuntimeError, tk.TclError):
+        # 主窗口已关闭，丢弃结果
+        pass
+
+def submit_task(func, args=(), on_done=None):
+    """提交后台任务，完成后在主线程中调用 on_done(result)"""
+    future = _pool.submit(func, *args)
+    if on_done:
+        future.add_done_callback(lambda f: _deliver_result(f, on_done))
+
+def run_command_async(argv, on_done, status_bar=None, task_name=None):
+    """在后台线程中执行命令，完成后在主线程中回调 on_done(output)"""
+    if status_bar and task_name:
+        status_bar.set_status(task_name, is_task=True)
+
+    def done(output):
         if status_bar and task_name:
-            status_bar.task_complete(task_name, success=False)
-        return error_msg
+            status_bar.task_complete(task_name, success="错误" not in output)
+        on_done(output)
+
+    submit_task(run_command, (argv,), done)
 
 def create_dockerfile(root):
     """生成 Dockerfile"""
@@ -91,7 +320,8 @@ EXPOSE 5000
 CMD ["python", "app.py"]
 """
         editor = TextEditor(root, "编辑 Dockerfile", dockerfile_content, 
-                          lambda content: save_dockerfile(content))
+                          lambda content: save_dockerfile(content),
+                          lambda: build_from_dockerfile(root, status_bar))
         
     except Exception as e:
         logging.error(f"生成Dockerfile失败: {str(e)}")
@@ -99,6 +329,7 @@ CMD ["python", "app.py"]
 
 def parse_args():
     """命令行参数解析"""
+    import argparse
     parser = argparse.ArgumentParser(description='Docker GUI工具')
     parser.add_argument('--cli', action='store_true', help='使用命令行模式')
     parser.add_argument('--action', choices=['build', 'run', 'push', 'stop'], help='执行的操作')
@@ -111,7 +342,7 @@ def parse_args():
 def list_images():
     """列出所有镜像"""
     try:
-        output = run_command('docker images')
+        output = run_command(['docker', 'images'])
         return output if output else "暂无镜像"
     except Exception as e:
         return f"错误: 无法获取镜像列表 - {str(e)}"
@@ -119,7 +350,7 @@ def list_images():
 def list_containers():
     """列出所有容器"""
     try:
-        output = run_command('docker ps -a')
+        output = run_command(['docker', 'ps', '-a'])
         return output if output else "暂无容器"
     except Exception as e:
         return f"错误: 无法获取容器列表 - {str(e)}"
@@ -127,7 +358,7 @@ def list_containers():
 def stop_container(container_name):
     """停止指定容器"""
     try:
-        output = run_command(f"docker stop {container_name}")
+        output = run_command(['docker', 'stop', container_name])
         logging.info(f"容器 {container_name} 已停止")
         return output
     except Exception as e:
@@ -136,7 +367,7 @@ def stop_container(container_name):
 
 def show_container_logs(container_name):
     """显示容器日志"""
-    return run_command(f"docker logs {container_name}")
+    return run_command(['docker', 'logs', container_name])
 
 def cli_mode(args):
     """命令行模式"""
@@ -163,12 +394,24 @@ def cli_mode(args):
         container_name = args.container or config['container_name']
         print(stop_container(container_name))
 
+# 列表列定义：(列名, 宽度)
+IMAGE_COLS = (('镜像名称', 300), ('标签', 100), ('ID', 200), ('大小', 100))
+CONTAINER_COLS = (('容器ID', 100), ('名称', 200), ('镜像', 200), ('状态', 150), ('端口', 150))
+REGISTRY_COLS = (('名称', 200), ('描述', 500), ('星标数', 100), ('官方', 100))
+
+def configure_tree(tree, cols, anchor='center'):
+    """按列定义设置 Treeview 的列、标题和宽度"""
+    tree['columns'] = [name for name, _ in cols]
+    for name, width in cols:
+        tree.heading(name, text=name, anchor=anchor)
+        tree.column(name, width=width)
+
 def create_gui():
     """创建图形用户界面"""
-    global image_tree, container_tree, root
+    global image_tree, container_tree, root, status_bar
     
-    if not check_docker_installed():
-        show_docker_error()
+    _load_gui()
+    if not ensure_docker_installed():
         return
         
     root = tk.Tk()
@@ -183,19 +426,27 @@ def create_gui():
     y = (screen_height - window_height) // 2
     root.geometry(f"{window_width}x{window_height}+{x}+{y}")
     
+    # 添加菜单栏
+    menu_bar = tk.Menu(root)
+    tools_menu = tk.Menu(menu_bar, tearoff=0)
+    tools_menu.add_command(label="查看程序日志", command=show_program_logs)
+    tools_menu.add_command(label="重新检测Docker", command=refresh_docker_check)
+    menu_bar.add_cascade(label="工具", menu=tools_menu)
+    root.config(menu=menu_bar)
+    
     # 添加状态栏
     status_bar = StatusBar(root)
     status_bar.pack(side=tk.BOTTOM, fill=tk.X)
     
     # 定义按钮样式
-    button_style = {
-        'font': ('Arial', 12),
-        'width': 20,
-        'height': 2,
-        'bg': "#A4C3D2",  # 莫兰迪蓝色系
-        'fg': "#2C3E50",
-        'relief': tk.RAISED
-    }
+    style = ttk.Style(root)
+    style.configure('Docker.TButton',
+                    font=('Arial', 12),
+                    width=20,
+                    padding=(0, 10),
+                    background="#A4C3D2",  # 莫兰迪蓝色系
+                    foreground="#2C3E50",
+                    relief=tk.RAISED)
     
     try:
         config = load_config()
@@ -216,13 +467,8 @@ def create_gui():
     status_notebook.add(image_frame, text="镜像状态")
     
     # 创建镜像列表
-    image_tree = ttk.Treeview(image_frame, columns=('镜像名称', '标签', 'ID', '大小'), show='headings')
-    for col in ('镜像名称', '标签', 'ID', '大小'):
-        image_tree.heading(col, text=col)
-    image_tree.column('镜像名称', width=300)
-    image_tree.column('标签', width=100)
-    image_tree.column('ID', width=200)
-    image_tree.column('大小', width=100)
+    image_tree = ttk.Treeview(image_frame, show='headings')
+    configure_tree(image_tree, IMAGE_COLS)
     
     image_scrollbar = ttk.Scrollbar(image_frame, orient=tk.VERTICAL, command=image_tree.yview)
     image_tree.configure(yscrollcommand=image_scrollbar.set)
@@ -234,41 +480,33 @@ def create_gui():
     image_button_frame = tk.Frame(image_frame, bg="#E8F4F8")
     image_button_frame.pack(side=tk.RIGHT, fill=tk.Y, padx=5, pady=5)
     
-    tk.Button(image_button_frame, text="生成Dockerfile",
-              command=lambda: create_dockerfile(root),
-              **button_style).pack(pady=5)
+    ttk.Button(image_button_frame, text="生成Dockerfile",
+               command=lambda: create_dockerfile(root),
+               style='Docker.TButton').pack(pady=5)
               
-    tk.Button(image_button_frame, text="构建镜像",
-              command=lambda: build_from_dockerfile(root, status_bar),
-              **button_style).pack(pady=5)
+    ttk.Button(image_button_frame, text="构建镜像",
+               command=lambda: build_from_dockerfile(root, status_bar),
+               style='Docker.TButton').pack(pady=5)
               
-    tk.Button(image_button_frame, text="删除镜像",
-              command=lambda: delete_selected_image(image_tree, status_bar),
-              **button_style).pack(pady=5)
+    ttk.Button(image_button_frame, text="删除镜像",
+               command=lambda: delete_selected_image(image_tree, status_bar),
+               style='Docker.TButton').pack(pady=5)
               
-    tk.Button(image_button_frame, text="推送镜像",
-              command=lambda: push_selected_image(image_tree, status_bar),
-              **button_style).pack(pady=5)
+    ttk.Button(image_button_frame, text="推送镜像",
+               command=lambda: push_selected_image(image_tree, status_bar),
+               style='Docker.TButton').pack(pady=5)
               
-    tk.Button(image_button_frame, text="查看远程镜像",
-              command=lambda: show_registry_images(root),
-              **button_style).pack(pady=5)
+    ttk.Button(image_button_frame, text="查看远程镜像",
+               command=lambda: show_registry_images(root),
+               style='Docker.TButton').pack(pady=5)
     
     # 容器状态页
     container_frame = ttk.Frame(status_notebook)
     status_notebook.add(container_frame, text="容器状态")
     
     # 创建容器列表
-    container_tree = ttk.Treeview(container_frame, 
-                                 columns=('容器ID', '名称', '镜像', '状态', '端口'),
-                                 show='headings')
-    for col in ('容器ID', '名称', '镜像', '状态', '端口'):
-        container_tree.heading(col, text=col)
-    container_tree.column('容器ID', width=100)
-    container_tree.column('名称', width=200)
-    container_tree.column('镜像', width=200)
-    container_tree.column('状态', width=150)
-    container_tree.column('端口', width=150)
+    container_tree = ttk.Treeview(container_frame, show='headings')
+    configure_tree(container_tree, CONTAINER_COLS)
     
     container_scrollbar = ttk.Scrollbar(container_frame, orient=tk.VERTICAL, command=container_tree.yview)
     container_tree.configure(yscrollcommand=container_scrollbar.set)
@@ -280,75 +518,192 @@ def create_gui():
     container_button_frame = tk.Frame(container_frame, bg="#E8F4F8")
     container_button_frame.pack(side=tk.RIGHT, fill=tk.Y, padx=5, pady=5)
     
-    tk.Button(container_button_frame, text="创建镜像",
-              command=lambda: create_image_from_selected_container(container_tree, status_bar),
-              **button_style).pack(pady=5)
+    ttk.Button(container_button_frame, text="创建镜像",
+               command=lambda: create_image_from_selected_container(container_tree, status_bar),
+               style='Docker.TButton').pack(pady=5)
               
-    tk.Button(container_button_frame, text="停止容器",
-              command=lambda: stop_selected_container(container_tree),
-              **button_style).pack(pady=5)
+    ttk.Button(container_button_frame, text="停止容器",
+               command=lambda: stop_selected_container(container_tree),
+               style='Docker.TButton').pack(pady=5)
     
-    def update_status():
+    # 窗口最小化或失去焦点时暂停轮询，恢复时立即刷新
+    root.bind('<FocusOut>', _on_window_hidden, add='+')
+    root.bind('<Unmap>', _on_window_hidden, add='+')
+    root.bind('<FocusIn>', _on_window_shown, add='+')
+    root.bind('<Map>', _on_window_shown, add='+')
+    
+    # 监听docker事件，容器/镜像变化时刷新列表
+    threading.Thread(target=_watch_docker_events, daemon=True).start()
+    
+    # 启动状态更新
+    update_status()
+    root.mainloop()
+    
+    if _events_proc:
+        _events_proc.terminate()
+    _pool.shutdown(wait=False, cancel_futures=True)
+
+# 状态轮询：列表无变化时间隔加倍（最长30秒），有变化时重置为2秒
+REFRESH_MIN_INTERVAL = 2000
+REFRESH_MAX_INTERVAL = 30000
+_refresh_interval = REFRESH_MIN_INTERVAL
+_refresh_after_id = None
+_refresh_running = False
+_refresh_requested = False
+_refresh_paused = False
+_window_unmapped = False  # 只有最小化才停止事件驱动的刷新，失去焦点时仍然响应事件
+_last_state_hash = None
+
+def update_status():
+    """刷新容器和镜像列表，并安排下一次轮询"""
+    global _refresh_after_id, _refresh_running, _refresh_requested
+    _refresh_after_id = None
+    if _refresh_running:
+        # 上一次刷新尚未返回，完成后再刷新一次
+        _refresh_requested = True
+        return
+    _refresh_running = True
+    
+    def on_state(state):
+        global _refresh_running, _refresh_requested, _refresh_interval, _last_state_hash
+        _refresh_running = False
         try:
-            # 更新容器列表
-            for item in container_tree.get_children():
-                container_tree.delete(item)
-            
-            containers = run_command('docker ps -a --format "{{.ID}}\t{{.Names}}\t{{.Image}}\t{{.Status}}\t{{.Ports}}"').split('\n')
-            for container in containers:
-                if container.strip():
-                    try:
-                        id_, name, image, status, ports = container.split('\t')
-                        container_tree.insert('', tk.END, values=(id_, name, image, status, ports))
-                    except ValueError:
-                        continue
-            
-            # 更新镜像列表
-            for item in image_tree.get_children():
-                image_tree.delete(item)
-            
-            images = run_command('docker images --format "{{.Repository}}\t{{.Tag}}\t{{.ID}}\t{{.Size}}"').split('\n')
-            for image in images:
-                if image.strip():
-                    try:
-                        repo, tag, id_, size = image.split('\t')
-                        image_tree.insert('', tk.END, values=(repo, tag, id_, size))
-                    except ValueError:
-                        continue
-            
-            root.after(5000, update_status)  # 每5秒更新一次
+            state_hash = hash(state)
+            if state_hash != _last_state_hash:
+                _last_state_hash = state_hash
+                _refresh_interval = REFRESH_MIN_INTERVAL
+                _render_state(image_tree, container_tree, state)
+            else:
+                _refresh_interval = min(_refresh_interval * 2, REFRESH_MAX_INTERVAL)
         except Exception as e:
             logging.error(f"更新状态时出错: {str(e)}")
             messagebox.showerror("错误", f"更新状态时出错: {str(e)}")
+        
+        if _refresh_requested:
+            _refresh_requested = False
+            update_status()
+        else:
+            _schedule_next_refresh()
     
-    # 启动状态更新
+    submit_task(fetch_state, (), on_state)
+
+def _schedule_next_refresh():
+    """按当前间隔安排下一次轮询，窗口隐藏时不安排"""
+    global _refresh_after_id
+    if _refresh_paused or _refresh_after_id is not None:
+        return
+    # 事件流正常时列表由事件驱动刷新，轮询只用于兜底
+    interval = REFRESH_MAX_INTERVAL if _events_proc else _refresh_interval
+    _refresh_after_id = root.after(interval, update_status)
+
+def _cancel_refresh():
+    """取消已安排的轮询"""
+    global _refresh_after_id
+    if _refresh_after_id is not None:
+        root.after_cancel(_refresh_after_id)
+        _refresh_after_id = None
+
+def schedule_refresh_now():
+    """在修改操作完成后立即刷新列表，并重置轮询间隔"""
+    global _refresh_interval
+    _cancel_refresh()
+    _refresh_interval = REFRESH_MIN_INTERVAL
     update_status()
-    root.mainloop()
 
-def show_container_logs_gui(root):
+# docker events 事件流：200ms 内的多个事件合并为一次刷新
+EVENT_DEBOUNCE_MS = 200
+IGNORED_EVENT_ACTIONS = ('exec_', 'attach', 'resize', 'top', 'copy',
+                         'archive-path', 'extract-to-dir', 'export')
+_events_proc = None
+_event_refresh_id = None
+
+def _watch_docker_events():
+    """后台线程：读取 docker events 输出，有相关事件时通知主线程刷新"""
+    global _events_proc
+    try:
+        _events_proc = subprocess.Popen(
+            ['docker', 'events', '--format', '{{json .}}',
+             '--filter', 'type=container', '--filter', 'type=image'],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
+        )
+    except OSError as e:
+        logging.error(f"监听docker事件失败: {str(e)}")
+        return
+    
+    # 事件行直接按字节解析，无需先解码
+    for line in _events_proc.stdout:
+        try:
+            event = json_loads(line)
+        except ValueError:
+            continue
+        if event.get('Action', '').startswith(IGNORED_EVENT_ACTIONS):
+            continue
+        try:
+            root.after(0, _on_docker_event)
+        except (RuntimeError, tk.TclError):
+            break
+    
+    # 事件流中断（例如docker服务重启），恢复为定时轮询
+    logging.warning("docker事件流已结束，恢复定时轮询")
+    _events_proc = None
+    try:
+        root.after(0, schedule_refresh_now)
+    except (RuntimeError, tk.TclError):
+        pass
+
+def _on_docker_event():
+    """收到docker事件，在合并窗口结束后刷新一次"""
+    global _event_refresh_id
+    if _window_unmapped or _event_refresh_id is not None:
+        return
+    _event_refresh_id = root.after(EVENT_DEBOUNCE_MS, _flush_docker_events)
+
+def _flush_docker_events():
+    global _event_refresh_id
+    _event_refresh_id = None
+    schedule_refresh_now()
+
+def _on_window_hidden(event):
+    """窗口最小化或切换到其他程序时暂停轮询；失去焦点时docker事件仍会触发刷新"""
+    global _window_unmapped
+    if event.widget is not root:
+        return
+    if event.type == tk.EventType.Unmap:
+        _window_unmapped = True
+        _pause_refresh()
+    else:
+        # 焦点可能只是转移到本程序的其他控件，空闲时再确认
+        root.after_idle(_pause_if_inactive)
+
+def _pause_if_inactive():
+    try:
+        focused = root.focus_get()
+    except KeyError:
+        focused = True
+    if focused is None:
+        _pause_refresh()
+
+def _pause_refresh():
+    global _refresh_paused
+    _refresh_paused = True
+    _cancel_refresh()
+
+def _on_window_shown(event):
+    """窗口恢复显示或重新获得焦点时立即刷新"""
+    global _refresh_paused, _window_unmapped
+    _window_unmapped = False
+    if not _refresh_paused:
+        return
+    _refresh_paused = False
+    schedule_refresh_now()
+
+def show_container_logs_gui(root, container_name=None):
     """显示容器日志的GUI函数"""
-    container_name = simpledialog.askstring("查看日志", "请输入容器名称:")
+    if not container_name:
+        container_name = simpledialog.askstring("查看日志", "请输入容器名称:")
     if container_name:
-        progress = ProgressWindow(root, "获取日志")
-        progress.update_status(f"正在获取容器 {container_name} 的日志...")
-        try:
-            logs = show_container_logs(container_name)
-            progress.finish()
-            
-            log_window = tk.Toplevel(root)
-            log_window.title(f"容器日志 - {container_name}")
-            log_window.geometry("1000x600")
-            
-            log_text = tk.Text(log_window, height=30, width=100, font=('Courier', 12))
-            log_scrollbar = ttk.Scrollbar(log_window, orient=tk.VERTICAL, command=log_text.yview)
-            log_text.configure(yscrollcommand=log_scrollbar.set)
-            
-            log_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10, pady=10)
-            log_scrollbar.pack(side=tk.RIGHT, fill=tk.Y, pady=10)
-            log_text.insert(tk.END, logs)
-        except Exception as e:
-            progress.finish()
-            messagebox.showerror("错误", f"获取日志失败: {str(e)}")
+        LogWindow(root, container_name)
 
 def create_image_from_container_gui(root):
     """从容器创建镜像的GUI函数"""
@@ -360,22 +715,13 @@ def create_image_from_container_gui(root):
             if tag:
                 progress = ProgressWindow(root, "创建镜像")
                 progress.update_status(f"正在从容器 {container_name} 创建镜像...")
-                try:
-                    output = commit_container(container_name, new_image_name, tag)
-                    progress.finish()
-                    if "错误" not in output:
-                        messagebox.showinfo("成功", f"已从容器 {container_name} 创建镜像 {new_image_name}:{tag}")
-                    else:
-                        messagebox.showerror("错误", output)
-                except Exception as e:
-                    progress.finish()
-                    messagebox.showerror("错误", f"创建镜像失败: {str(e)}")
+                commit_container(container_name, new_image_name, tag,
+                                 on_done=lambda success: progress.finish())
 
 def build_image(image_name, tag_name):
     """构建Docker镜像"""
     try:
-        command = f"docker build -t {image_name}:{tag_name} ."
-        output = run_command(command)
+        output = run_command(['docker', 'build', '-t', f"{image_name}:{tag_name}", '.'])
         logging.info(f"镜像构建成功: {image_name}:{tag_name}")
         return output
     except Exception as e:
@@ -385,8 +731,8 @@ def build_image(image_name, tag_name):
 def run_container(image_name, tag_name, container_name, port_mapping):
     """运行Docker容器"""
     try:
-        command = f"docker run -d -p {port_mapping} --name {container_name} {image_name}:{tag_name}"
-        output = run_command(command)
+        output = run_command(['docker', 'run', '-d', '-p', port_mapping,
+                              '--name', container_name, f"{image_name}:{tag_name}"])
         logging.info(f"容器启动成功: {container_name}")
         return output
     except Exception as e:
@@ -396,8 +742,7 @@ def run_container(image_name, tag_name, container_name, port_mapping):
 def push_image(image_name, tag_name):
     """推送Docker镜像"""
     try:
-        command = f"docker push {image_name}:{tag_name}"
-        output = run_command(command)
+        output = run_command(['docker', 'push', f"{image_name}:{tag_name}"])
         logging.info(f"镜像推送成功: {image_name}:{tag_name}")
         return output
     except Exception as e:
@@ -409,32 +754,30 @@ def check_registry_images(parent_window, image_name):
     try:
         progress = ProgressWindow(parent_window, "检查远程镜像")
         progress.update_status("正在查询Docker Hub...")
-        output = run_command(f'docker search {image_name}')
+        output = cached_search(image_name)
         progress.finish()
         return output
     except Exception as e:
         return f"错误: 无法获取远程镜像信息 - {str(e)}"
 
-def commit_container(container_id, new_image_name, tag="latest", status_bar=None):
-    """从容器创建新镜像"""
-    try:
-        task_name = "创建镜像"
-        command = f'docker commit {container_id} {new_image_name}:{tag}'
-        output = run_command(command, status_bar, task_name)
-        
-        if "错误" not in output:
+def commit_container(container_id, new_image_name, tag="latest", status_bar=None, on_done=None):
+    """从容器创建新镜像，完成后回调 on_done(success)"""
+    task_name = "创建镜像"
+    argv = ['docker', 'commit', container_id, f"{new_image_name}:{tag}"]
+    
+    def done(output):
+        success = "错误" not in output
+        if success:
             logging.info(f"成功从容器 {container_id} 创建镜像 {new_image_name}:{tag}")
             messagebox.showinfo("成功", f"已从容器 {container_id} 创建镜像 {new_image_name}:{tag}")
-            return True
+            schedule_refresh_now()
         else:
             logging.error(f"创建镜像失败: {output}")
             messagebox.showerror("错误", output)
-            return False
-    except Exception as e:
-        error_msg = f"创建镜像失败: {str(e)}"
-        logging.error(error_msg)
-        messagebox.showerror("错误", error_msg)
-        return False
+        if on_done:
+            on_done(success)
+    
+    run_command_async(argv, done, status_bar, task_name)
 
 def create_image_from_selected_container(tree, status_bar):
     """从选中的容器创建镜像"""
@@ -443,117 +786,19 @@ def create_image_from_selected_container(tree, status_bar):
         messagebox.showwarning("警告", "请先选择一个容器")
         return
     
-    container_id = tree.item(selection[0])['values'][0]
+    container_id = selection[0]  # 容器列表以容器ID作为行键
     new_image_name = simpledialog.askstring("创建镜像", "请输入新镜像名称:")
     if new_image_name:
         tag = simpledialog.askstring("创建镜像", "请输入标签(默认latest):", initialvalue="latest")
         if tag:
-            if commit_container(container_id, new_image_name, tag, status_bar):
-                # 获取主窗口中的树形控件
-                main_window = tree.winfo_toplevel()
-                for child in main_window.winfo_children():
-                    if isinstance(child, ttk.Treeview):
-                        if 'ID' in child['columns']:  # 镜像树
-                            image_tree = child
-                        elif '容器ID' in child['columns']:  # 容器树
-                            container_tree = child
-                update_lists(image_tree, container_tree)
-
-class TextEditor(tk.Toplevel):
-    def __init__(self, parent, title, initial_text="", callback=None):
-        super().__init__(parent)
-        self.title(title)
-        self.callback = callback
-        
-        # 设置窗口大小
-        self.geometry("800x600")
-        
-        # 创建文本编辑区
-        self.text_area = tk.Text(self, wrap=tk.WORD, font=('Courier', 12),
-                               bg="#E8F4F8", fg="#2C3E50")  # 莫兰迪蓝色系
-        self.text_area.pack(expand=True, fill='both', padx=10, pady=5)
-        self.text_area.insert('1.0', initial_text)
-        
-        # 添加推荐链接
-        recommend_label = tk.Label(
-            self,
-            text="推荐在 https://github.com/expoli/docker-compose-files 获取Dockerfile模板",
-            fg="#2C3E50",
-            cursor="hand2"
-        )
-        recommend_label.pack(pady=5)
-        recommend_label.bind("<Button-1>", 
-                           lambda e: webbrowser.open("https://github.com/expoli/docker-compose-files"))
-        
-        # 创建按钮框
-        button_frame = tk.Frame(self)
-        button_frame.pack(fill='x', padx=10, pady=5)
-        
-        # 保存按钮
-        tk.Button(button_frame, text="保存并构建",
-                 command=self.save_and_build,
-                 bg="#A4C3D2", fg="#2C3E50").pack(side=tk.RIGHT, padx=5)
-        tk.Button(button_frame, text="仅保存",
-                 command=self.save_and_close,
-                 bg="#A4C3D2", fg="#2C3E50").pack(side=tk.RIGHT, padx=5)
-        tk.Button(button_frame, text="取消",
-                 command=self.destroy,
-                 bg="#A4C3D2", fg="#2C3E50").pack(side=tk.RIGHT, padx=5)
-    
-    def save_and_build(self):
-        if self.callback:
-            self.callback(self.text_area.get('1.0', tk.END))
-        self.destroy()
-        build_from_dockerfile(self.master, self.master.status_bar)
-
-    def save_and_close(self):
-        if self.callback:
-            self.callback(self.text_area.get('1.0', tk.END))
-        self.destroy()
-
-class ProgressWindow(tk.Toplevel):
-    def __init__(self, parent, title):
-        super().__init__(parent)
-        self.title(title)
-        
-        # 设置窗口大小和位置
-        self.geometry("400x150")
-        self.transient(parent)
-        self.grab_set()
-        
-        # 进度条
-        self.progress = ttk.Progressbar(self, mode='indeterminate', length=300)
-        self.progress.pack(pady=20)
-        
-        # 状态标签
-        self.status_label = tk.Label(self, text="处理中...", font=('Arial', 10))
-        self.status_label.pack(pady=10)
-        
-        self.progress.start(10)
-    
-    def update_status(self, text):
-        self.status_label.config(text=text)
-    
-    def finish(self):
-        self.progress.stop()
-        self.destroy()
+            # commit_container 成功后会立即刷新镜像和容器列表
+            commit_container(container_id, new_image_name, tag, status_bar)
 
 def create_image_list(image_frame):
     """创建镜像列表"""
     # 创建表格
-    columns = ('镜像名称', '标签', 'ID', '大小')
-    tree = ttk.Treeview(image_frame, columns=columns, show='headings', selectmode='browse')
-    
-    # 设置列标题和宽度
-    tree.heading('镜像名称', text='镜像名称', anchor='w')
-    tree.heading('标签', text='标签', anchor='w')
-    tree.heading('ID', text='ID', anchor='w')
-    tree.heading('大小', text='大小', anchor='w')
-    
-    tree.column('镜像名称', width=300)
-    tree.column('标签', width=100)
-    tree.column('ID', width=200)
-    tree.column('大小', width=100)
+    tree = ttk.Treeview(image_frame, show='headings', selectmode='browse')
+    configure_tree(tree, IMAGE_COLS, anchor='w')
     
     # 添加滚动条
     scrollbar = ttk.Scrollbar(image_frame, orient=tk.VERTICAL, command=tree.yview)
@@ -567,29 +812,65 @@ def create_image_list(image_frame):
 
 def update_image_list(tree):
     """更新镜像列表"""
-    # 记住当前选中项
-    selected = None
-    selection = tree.selection()
-    if selection:
-        current = tree.item(selection[0])
-        if current and 'values' in current:
-            selected = current['values'][2]  # 保存 ID
-    
-    # 清空现有项目
-    for item in tree.get_children():
-        tree.delete(item)
-    
-    # 获取镜像列表
-    images = run_command('docker images --format "{{.Repository}}\t{{.Tag}}\t{{.ID}}\t{{.Size}}"').split('\n')
-    
-    # 添加到表格
-    for image in images:
-        if image.strip():
-            repo, tag, id_, size = image.split('\t')
-            item = tree.insert('', tk.END, values=(repo, tag, id_, size))
-            # 恢复选中状态
-            if selected and id_ == selected:
-                tree.selection_set(item)
+    images = run_command(IMG_CMD)
+    _sync_tree(tree, _parse_image_rows(images))
+
+# Treeview 行缓存：{控件路径: {行键: 值}}，行键同时作为 Treeview 的 iid
+_tree_rows = {}
+
+def _sync_tree(tree, rows):
+    """与上次的数据对比，只插入、删除或更新有变化的行，选中状态和滚动位置得以保留"""
+    cached_rows = _tree_rows.setdefault(str(tree), {})
+    
+    for key in list(cached_rows):
+        if key not in rows:
+            tree.delete(key)
+            del cached_rows[key]
+    
+    for key, values in rows.items():
+        old_values = cached_rows.get(key)
+        if old_values is None:
+            tree.insert('', tk.END, iid=key, values=values)
+        elif old_values != values:
+            tree.item(key, values=values)
+        cached_rows[key] = values
+    
+    # 保持与命令输出相同的顺序（例如新建的容器排在最前），move 不影响选中状态
+    order = tuple(rows)
+    if tree.get_children() != order:
+        for index, key in enumerate(order):
+            tree.move(key, '', index)
+
+def _row_values(tree, key):
+    """取缓存的原始行数据；Treeview 会把纯数字的值转成整数，丢失前导零"""
+    return _tree_rows[str(tree)][key]
+
+def _parse_container_rows(output):
+    """解析容器列表输出，返回 {容器ID: 行数据}"""
+    rows = {}
+    for line in output.split('\n'):
+        # 每行一个 JSON 对象，出错时的提示信息不以 { 开头，直接跳过
+        if line.startswith('{'):
+            obj = json_loads(line)
+            rows[obj['ID']] = (obj['ID'], obj['Names'], obj['Image'], obj['Status'], obj['Ports'])
+    return rows
+
+def _parse_image_rows(output):
+    """解析镜像列表输出，返回 {镜像ID:仓库:标签: 行数据}"""
+    rows = {}
+    for line in output.split('\n'):
+        if line.startswith('{'):
+            obj = json_loads(line)
+            repo, tag, id_ = obj['Repository'], obj['Tag'], obj['ID']
+            # 同一镜像ID可能对应多个标签
+            rows[f"{id_}:{repo}:{tag}"] = (repo, tag, id_, obj['Size'])
+    return rows
+
+def _render_state(image_tree, container_tree, state):
+    """将 fetch_state 的结果同步到镜像和容器列表"""
+    containers, images = state
+    _sync_tree(container_tree, _parse_container_rows(containers))
+    _sync_tree(image_tree, _parse_image_rows(images))
 
 def delete_selected_image(tree, status_bar):
     """删除选中的镜像"""
@@ -598,24 +879,17 @@ def delete_selected_image(tree, status_bar):
         messagebox.showwarning("警告", "请先选择要删除的镜像")
         return
     
-    item = selection[0]
-    values = tree.item(item)['values']
-    image_id = values[2]  # ID 在第三列
+    image_id = _row_values(tree, selection[0])[2]  # ID 在第三列
     
     if messagebox.askyesno("确认", f"确定要删除选中的镜像吗？\n这将强制删除镜像及其所有标签。"):
-        status_bar.set_status("删除镜像", is_task=True)
-        try:
-            output = run_command(f"docker rmi -f {image_id}")
+        def on_done(output):
             if "错误" not in output:
                 messagebox.showinfo("成功", "镜像已删除")
-                status_bar.task_complete("删除镜像", success=True)
-                update_lists(image_tree, container_tree)
+                schedule_refresh_now()
             else:
                 messagebox.showerror("错误", output)
-                status_bar.task_complete("删除镜像", success=False)
-        except Exception as e:
-            messagebox.showerror("错误", f"删除失败: {str(e)}")
-            status_bar.task_complete("删除镜像", success=False)
+        
+        run_command_async(['docker', 'rmi', '-f', image_id], on_done, status_bar, "删除镜像")
 
 def create_container_from_image(tree):
     """从选中的镜像创建并运行容器"""
@@ -624,9 +898,7 @@ def create_container_from_image(tree):
         messagebox.showwarning("警告", "请先选择一个镜像")
         return
     
-    item = selection[0]
-    values = tree.item(item)['values']
-    repo, tag = values[0], values[1]
+    repo, tag = _row_values(tree, selection[0])[:2]
     
     # 获取容器配置
     container_name = simpledialog.askstring("容器名称", "请输入容器名称:")
@@ -647,6 +919,7 @@ def create_container_from_image(tree):
             messagebox.showerror("错误", output)
         else:
             messagebox.showinfo("成功", f"容器 {container_name} 已创建并启动")
+            schedule_refresh_now()
     except Exception as e:
         progress.finish()
         messagebox.showerror("错误", str(e))
@@ -658,14 +931,14 @@ def check_registry_images_gui(root):
         progress = ProgressWindow(root, "检查远程镜像")
         progress.update_status("正在查询Docker Hub...")
         try:
-            output = run_command(f'docker search {image_name}')
+            output = cached_search(image_name)
             progress.finish()
             
             result_window = tk.Toplevel(root)
             result_window.title(f"远程镜像查询结果 - {image_name}")
             result_window.geometry("1000x600")
             
-            result_text = tk.Text(result_window, height=30, width=100, font=('Courier', 12))
+            result_text = tk.Text(result_window, height=30, width=100, font=log_font())
             result_scrollbar = ttk.Scrollbar(result_window, orient=tk.VERTICAL, command=result_text.yview)
             result_text.configure(yscrollcommand=result_scrollbar.set)
             
@@ -681,6 +954,7 @@ def save_dockerfile(content):
     try:
         with open("Dockerfile", "w", encoding='utf-8') as f:
             f.write(content)
+        _invalidate_stat("Dockerfile")
         logging.info("Dockerfile生成成功")
         messagebox.showinfo("成功", "Dockerfile 已生成在当前目录下。")
     except Exception as e:
@@ -689,25 +963,7 @@ def save_dockerfile(content):
 
 def update_lists(image_tree, container_tree):
     """更新镜像和容器列表"""
-    # 更新镜像列表
-    for item in image_tree.get_children():
-        image_tree.delete(item)
-    
-    images = run_command('docker images --format "{{.Repository}}\t{{.Tag}}\t{{.ID}}\t{{.Size}}"').split('\n')
-    for image in images:
-        if image.strip():
-            repo, tag, id_, size = image.split('\t')
-            image_tree.insert('', tk.END, values=(repo, tag, id_, size))
-    
-    # 更新容器列表
-    for item in container_tree.get_children():
-        container_tree.delete(item)
-    
-    containers = run_command('docker ps -a --format "{{.ID}}\t{{.Names}}\t{{.Image}}\t{{.Status}}\t{{.Ports}}"').split('\n')
-    for container in containers:
-        if container.strip():
-            id_, name, image, status, ports = container.split('\t')
-            container_tree.insert('', tk.END, values=(id_, name, image, status, ports))
+    submit_task(fetch_state, (), lambda state: _render_state(image_tree, container_tree, state))
 
 def show_registry_images(root):
     """显示远程镜像列表"""
@@ -724,13 +980,8 @@ def show_registry_images(root):
     search_entry.pack(side=tk.LEFT, padx=5)
     
     # 创建结果列表
-    tree = ttk.Treeview(result_window, columns=('名称', '描述', '星标数', '官方'), show='headings')
-    for col in ('名称', '描述', '星标数', '官方'):
-        tree.heading(col, text=col)
-    tree.column('名称', width=200)
-    tree.column('描述', width=500)
-    tree.column('星标数', width=100)
-    tree.column('官方', width=100)
+    tree = ttk.Treeview(result_window, show='headings')
+    configure_tree(tree, REGISTRY_COLS)
     
     scrollbar = ttk.Scrollbar(result_window, orient=tk.VERTICAL, command=tree.yview)
     tree.configure(yscrollcommand=scrollbar.set)
@@ -738,25 +989,40 @@ def show_registry_images(root):
     tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10, pady=5)
     scrollbar.pack(side=tk.RIGHT, fill=tk.Y, pady=5)
     
-    def search():
+    def search(refresh=False):
         progress = ProgressWindow(result_window, "搜索镜像")
         progress.update_status("正在搜索...")
-        try:
-            output = run_command(f'docker search {search_entry.get()} --format "{{{{.Name}}}}\t{{{{.Description}}}}\t{{{{.StarCount}}}}\t{{{{.IsOfficial}}}}"')
-            for item in tree.get_children():
-                tree.delete(item)
-            
-            for line in output.split('\n'):
-                if line.strip():
-                    name, desc, stars, official = line.split('\t')
-                    tree.insert('', tk.END, values=(name, desc, stars, official))
-            
-        except Exception as e:
-            messagebox.showerror("错误", f"搜索失败: {str(e)}")
-        finally:
-            progress.finish()
+        
+        def on_done(output):
+            try:
+                if output.startswith("错误"):
+                    messagebox.showerror("错误", f"搜索失败: {output}")
+                    return
+                
+                for item in tree.get_children():
+                    tree.delete(item)
+                
+                for line in output.split('\n'):
+                    if line.startswith('{'):
+                        obj = json_loads(line)
+                        # 镜像名称作为行键，拉取时直接使用，不经过 Treeview 的类型转换
+                        if not tree.exists(obj['Name']):
+                            tree.insert('', tk.END, iid=obj['Name'],
+                                        values=(obj['Name'], obj['Description'],
+                                                obj['StarCount'], obj['IsOfficial']))
+                
+            except Exception as e:
+                messagebox.showerror("错误", f"搜索失败: {str(e)}")
+            finally:
+                progress.finish()
+        
+        submit_task(cached_search,
+                    (search_entry.get(), "{{json .}}",
+                     SEARCH_CACHE_TTL, refresh),
+                    on_done)
     
     tk.Button(search_frame, text="搜索", command=search).pack(side=tk.LEFT, padx=5)
+    tk.Button(search_frame, text="刷新", command=lambda: search(refresh=True)).pack(side=tk.LEFT, padx=5)
     
     def pull_selected():
         selection = tree.selection()
@@ -764,20 +1030,19 @@ def show_registry_images(root):
             messagebox.showwarning("警告", "请先选择一个镜像")
             return
         
-        image_name = tree.item(selection[0])['values'][0]
+        image_name = selection[0]
         progress = ProgressWindow(result_window, "拉取镜像")
         progress.update_status(f"正在拉取 {image_name}...")
-        try:
-            output = run_command(f'docker pull {image_name}')
+        
+        def on_done(output):
             progress.finish()
             if "错误" not in output:
                 messagebox.showinfo("成功", f"镜像 {image_name} 已拉取")
-                update_lists(image_tree, container_tree)
+                schedule_refresh_now()
             else:
                 messagebox.showerror("错误", output)
-        except Exception as e:
-            progress.finish()
-            messagebox.showerror("错误", f"拉取失败: {str(e)}")
+        
+        run_command_async(['docker', 'pull', image_name], on_done)
     
     tk.Button(result_window, text="拉取选中镜像", command=pull_selected).pack(pady=5)
 
@@ -788,7 +1053,7 @@ def show_selected_container_logs(tree):
         messagebox.showwarning("警告", "请先选择一个容器")
         return
     
-    container_id = tree.item(selection[0])['values'][0]
+    container_id = selection[0]  # 容器列表以容器ID作为行键
     show_container_logs_gui(root, container_id)
 
 def stop_selected_container(tree):
@@ -798,57 +1063,57 @@ def stop_selected_container(tree):
         messagebox.showwarning("警告", "请先选择一个容器")
         return
     
-    container_id = tree.item(selection[0])['values'][0]
+    container_id = selection[0]  # 容器列表以容器ID作为行键
     if messagebox.askyesno("确认", "确定要停止选中的容器吗？"):
         progress = ProgressWindow(root, "停止容器")
         progress.update_status(f"正在停止容器 {container_id}...")
-        try:
-            output = stop_container(container_id)
+        
+        def on_done(output):
             progress.finish()
             if "错误" not in output:
                 messagebox.showinfo("成功", "容器已停止")
-                update_lists(image_tree, container_tree)
+                schedule_refresh_now()
             else:
                 messagebox.showerror("错误", output)
-        except Exception as e:
-            progress.finish()
-            messagebox.showerror("错误", f"停止失败: {str(e)}")
-
-class StatusBar(tk.Frame):
-    def __init__(self, master):
-        super().__init__(master)
-        self.label = tk.Label(self, bd=1, relief=tk.SUNKEN, anchor=tk.CENTER,
-                            bg="#A4C3D2", fg="#2C3E50",
-                            font=('Arial', 10))
-        self.label.pack(fill=tk.X)
-        self.task_start_time = None
         
-    def set_status(self, text, is_task=False):
-        if is_task:
-            self.task_start_time = datetime.now()
-            self.label.config(text=f"{text}任务正在进行中.....")
-            self.check_timeout(text)
+        submit_task(stop_container, (container_id,), on_done)
+
+LOG_TAIL_BYTES = 512 * 1024  # 打开日志窗口时只读取末尾 512KB
+LOG_CHUNK_BYTES = 64 * 1024  # 每次插入文本框 64KB
+
+def _stream_file_to_text(window, log_text, f):
+    """分块把文件内容插入文本框，每块之间让出事件循环，读完后关闭文件；
+    窗口关闭或调用返回的 stop() 时取消剩余的加载并关闭文件"""
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    chunks = iter(lambda: f.read(LOG_CHUNK_BYTES), b'')
+    after_id = None
+    
+    def stop(event=None):
+        nonlocal after_id
+        if event is not None and event.widget is not window:
+            return
+        if after_id is not None:
+            window.after_cancel(after_id)
+            after_id = None
+        f.close()
+    
+    def pump():
+        nonlocal after_id
+        after_id = None
+        chunk = next(chunks, b'')
+        # 仅在插入时开放编辑，其余时间保持只读
+        log_text.config(state=tk.NORMAL)
+        log_text.insert(tk.END, decoder.decode(chunk, final=not chunk))
+        log_text.config(state=tk.DISABLED)
+        if chunk:
+            after_id = window.after(0, pump)
         else:
-            current_time = datetime.now().strftime("%H:%M:%S")
-            self.label.config(text=f"{text} - {current_time}")
-    
-    def check_timeout(self, task_name):
-        if self.task_start_time:
-            elapsed = (datetime.now() - self.task_start_time).total_seconds()
-            if elapsed >= 60:  # 1分钟超时
-                self.task_complete(task_name, success=False, message="任务超时")
-            else:
-                self.after(1000, lambda: self.check_timeout(task_name))
-    
-    def task_complete(self, task_name, success=True, message=None):
-        self.task_start_time = None
-        current_time = datetime.now().strftime("%H:%M:%S")
-        status = "成功" if success else "失败"
-        status_text = f"{task_name}任务{status}"
-        if message:
-            status_text += f": {message}"
-        status_text += f" - {current_time}"
-        self.label.config(text=status_text)
+            f.close()
+            log_text.see(tk.END)
+    
+    window.bind('<Destroy>', stop, add='+')
+    after_id = window.after(0, pump)
+    return stop
 
 def show_program_logs():
     """显示程序日志"""
@@ -856,8 +1121,10 @@ def show_program_logs():
     log_window.title("程序日志")
     log_window.geometry("1000x600")
     
-    log_text = tk.Text(log_window, height=30, width=100, font=('Courier', 12),
-                      bg="#E8F4F8", fg="#2C3E50")  # 莫兰迪蓝色系
+    button_frame = tk.Frame(log_window)
+    button_frame.pack(side=tk.BOTTOM, fill='x', padx=10, pady=5)
+    
+    log_text = tk.Text(log_window, height=30, width=100, font=log_font(), **LOG_TEXT_COLORS)
     log_scrollbar = ttk.Scrollbar(log_window, orient=tk.VERTICAL, command=log_text.yview)
     log_text.configure(yscrollcommand=log_scrollbar.set)
     
@@ -865,14 +1132,111 @@ def show_program_logs():
     log_scrollbar.pack(side=tk.RIGHT, fill=tk.Y, pady=10)
     
     try:
-        with open(f'docker_gui_{datetime.now().strftime("%Y%m%d")}.log', 'r', encoding='utf-8') as f:
-            log_text.insert(tk.END, f.read())
+        f = open(LOG_FILE, 'rb')
+        size = f.seek(0, os.SEEK_END)
+        start = max(0, size - LOG_TAIL_BYTES)
+        f.seek(start)
+        if start > 0:
+            # 丢弃被截断的第一行
+            f.readline()
     except Exception as e:
         log_text.insert(tk.END, f"无法读取日志文件: {str(e)}")
+        return
+    stop_loading = _stream_file_to_text(log_window, log_text, f)
+    
+    def load_full():
+        """重新分块加载完整日志"""
+        try:
+            full_file = open(LOG_FILE, 'rb')
+        except Exception as e:
+            messagebox.showerror("错误", f"无法读取日志文件: {str(e)}")
+            return
+        stop_loading()  # 停止尚未加载完的末尾部分
+        load_button.config(state=tk.DISABLED)
+        log_text.config(state=tk.NORMAL)
+        log_text.delete('1.0', tk.END)
+        _stream_file_to_text(log_window, log_text, full_file)
+    
+    if start > 0:
+        load_button = tk.Button(button_frame, text="加载完整日志", command=load_full,
+                                bg="#A4C3D2", fg="#2C3E50")
+        load_button.pack(side=tk.RIGHT, padx=5)
+
+# 文件状态缓存：{路径: (检查时间, stat 结果或 None)}
+STAT_CACHE_TTL = 1.0
+_stat_results = {}
+
+def _stat_cache(path, ttl=STAT_CACHE_TTL):
+    """返回 os.stat(path) 的结果，文件不存在时返回 None；ttl 秒内重复调用直接使用缓存"""
+    cached = _stat_results.get(path)
+    now = time.monotonic()
+    if cached and now - cached[0] < ttl:
+        return cached[1]
+    try:
+        st = os.stat(path)
+    except OSError:
+        st = None
+    _stat_results[path] = (now, st)
+    return st
+
+def _invalidate_stat(path):
+    """文件被本程序修改后清除缓存"""
+    _stat_results.pop(path, None)
+
+# 构建时启用 BuildKit，输出使用逐行的 plain 格式；
+# 未安装 buildx 插件时改用旧版构建器，本次运行中不再尝试 BuildKit
+BUILD_ENV = {**os.environ, "DOCKER_BUILDKIT": "1"}
+LEGACY_BUILD_ENV = {**os.environ, "DOCKER_BUILDKIT": "0"}
+BUILDX_MISSING_MSG = "buildx component is missing"
+_buildkit_available = True
+
+def build_command(image_name, tag, quiet=False, cache_from=False):
+    """生成构建命令；重新构建时以同名镜像作为缓存来源，并写入内联缓存信息供下次构建复用"""
+    ref = f"{image_name}:{tag}"
+    argv = ['docker', 'build', '--progress=plain', '-t', ref,
+            '--build-arg', 'BUILDKIT_INLINE_CACHE=1']
+    if cache_from:
+        argv += ['--cache-from', ref]
+    if quiet:
+        argv.append('--quiet')
+    argv.append('.')
+    return argv
+
+def legacy_build_command(image_name, tag, quiet=False):
+    """生成旧版构建器使用的构建命令"""
+    argv = ['docker', 'build', '-t', f"{image_name}:{tag}"]
+    if quiet:
+        argv.append('--quiet')
+    argv.append('.')
+    return argv
+
+def build_quiet_enabled():
+    """配置文件中 build_quiet 为 true 时构建只输出镜像ID"""
+    try:
+        return bool(load_config().get('build_quiet', False))
+    except Exception:
+        return False
+
+def image_exists(ref):
+    """本地是否已有该镜像（不访问远程仓库）"""
+    return execute_command(['docker', 'image', 'inspect', '--format', '{{.Id}}', ref]).returncode == 0
+
+def _build_image(image_name, tag, quiet, on_line):
+    """构建镜像（在后台线程中执行）；本地已有同名镜像时才把它作为缓存来源，
+    否则 BuildKit 会尝试从远程仓库拉取缓存"""
+    global _buildkit_available
+    if _buildkit_available:
+        cache_from = image_exists(f"{image_name}:{tag}")
+        result = run_command_stream(build_command(image_name, tag, quiet, cache_from), on_line, BUILD_ENV)
+        if result.returncode == 0 or BUILDX_MISSING_MSG not in result.stderr:
+            return result
+        logging.warning("未检测到buildx插件，改用旧版构建器")
+        _buildkit_available = False
+    return run_command_stream(legacy_build_command(image_name, tag, quiet), on_line, LEGACY_BUILD_ENV)
 
 def build_from_dockerfile(root, status_bar):
     """从Dockerfile构建镜像"""
-    if not os.path.exists("Dockerfile"):
+    if _stat_cache("Dockerfile") is None:
         messagebox.showerror("错误", "当前目录下不存在Dockerfile")
         return
         
@@ -881,42 +1245,96 @@ def build_from_dockerfile(root, status_bar):
         tag = simpledialog.askstring("构建镜像", "请输入标签(默认latest):", initialvalue="latest")
         if tag:
             status_bar.set_status("构建镜像", is_task=True)
-            try:
-                output = run_command(f"docker build -t {image_name}:{tag} .")
-                if "错误" not in output:
-                    messagebox.showinfo("成功", f"镜像 {image_name}:{tag} 构建成功")
-                    status_bar.task_complete("构建镜像", success=True)
-                else:
-                    messagebox.showerror("错误", output)
-                    status_bar.task_complete("构建镜像", success=False)
-            except Exception as e:
-                messagebox.showerror("错误", f"构建失败: {str(e)}")
-                status_bar.task_complete("构建镜像", success=False)
+            
+            def on_line(line):
+                # 在后台线程中调用，交回主线程更新状态栏
+                try:
+                    root.after(0, status_bar.set_status, line[:80])
+                except (RuntimeError, tk.TclError):
+                    pass
+            
+            submit_task(_build_image,
+                        (image_name, tag, build_quiet_enabled(), on_line),
+                        lambda result: _after_build(result, status_bar, image_name, tag))
 
+def _after_build(result, status_bar, image_name, tag):
+    """构建完成后在主线程中提示结果"""
+    if isinstance(result, str):
+        messagebox.showerror("错误", f"构建失败: {result}")
+        status_bar.task_complete("构建镜像", success=False)
+    elif result.returncode == 0:
+        messagebox.showinfo("成功", f"镜像 {image_name}:{tag} 构建成功")
+        status_bar.task_complete("构建镜像", success=True)
+        schedule_refresh_now()
+    else:
+        messagebox.showerror("错误", f"构建失败: {result.stderr}")
+        status_bar.task_complete("构建镜像", success=False)
+
+@functools.lru_cache(maxsize=1)
 def check_docker_installed():
-    """检查是否安装了Docker"""
-    try:
-        output = subprocess.run(['docker', '--version'], 
-                              stdout=subprocess.PIPE, 
-                              stderr=subprocess.PIPE,
-                              encoding='utf-8')
-        return output.returncode == 0
-    except FileNotFoundError:
-        return False
+    """检查是否安装了Docker（只在 PATH 中查找可执行文件，不启动进程；结果在本次运行中缓存）"""
+    return shutil.which('docker') is not None
 
 def show_docker_error():
-    """显示Docker未安装错误"""
-    messagebox.showerror(
+    """显示Docker未安装错误，用户选择重试时返回 True"""
+    return messagebox.askretrycancel(
         "错误",
         "未检测到Docker，请先安装Docker！\n" +
         "Windows安装教程：https://docs.docker.com/desktop/install/windows-install/\n" +
         "Linux安装教程：https://docs.docker.com/engine/install/"
     )
 
+def refresh_docker_check():
+    """清除检测缓存并重新检测Docker，用于程序运行期间安装或重装了Docker的情况"""
+    check_docker_installed.cache_clear()
+    if ensure_docker_installed():
+        messagebox.showinfo("提示", "已检测到Docker")
+
+def ensure_docker_installed():
+    """检查是否安装了Docker，未安装时提示，用户安装后可重试"""
+    while not check_docker_installed():
+        if not show_docker_error():
+            return False
+        check_docker_installed.cache_clear()
+    return True
+
+# 本次运行中已成功登录过的镜像仓库，推送前不再重复 docker login
+DEFAULT_REGISTRY = "docker.io"
+_logged_in_registries = set()
+
+def registry_of(image_name):
+    """从镜像名称中取出仓库地址，没有显式仓库时为 Docker Hub"""
+    first, sep, _ = image_name.partition('/')
+    if sep and ('.' in first or ':' in first or first == 'localhost'):
+        return first
+    return DEFAULT_REGISTRY
+
+def ensure_logged_in(registry):
+    """登录镜像仓库，本次运行中已登录成功的仓库直接返回 True"""
+    if registry in _logged_in_registries:
+        return True
+    argv = ['docker', 'login']
+    if registry != DEFAULT_REGISTRY:
+        argv.append(registry)
+    if execute_command(argv).returncode != 0:
+        return False
+    _logged_in_registries.add(registry)
+    return True
+
+# 推送确认信息模板
+CONFIRM_TMPL = """
+请确认以下推送信息：
+
+镜像名称: {name}
+标签: {tag}
+完整名称: {name}:{tag}
+
+是否继续？
+"""
+
 def push_selected_image(tree, status_bar):
     """推送选中的镜像"""
-    if not check_docker_installed():
-        show_docker_error()
+    if not ensure_docker_installed():
         return
         
     selection = tree.selection()
@@ -928,49 +1346,43 @@ def push_selected_image(tree, status_bar):
         config = load_config()
         image_name = config['image_name']  # 从配置文件获取镜像名称
         
-        # 获取标签
-        tag = simpledialog.askstring("推送镜像", "请输入标签名称:", 
-                                   initialvalue="latest")
-        if not tag:
-            return
-            
-        # 确认信息
-        confirm_msg = f"""
-请确认以下推送信息：
-
-镜像名称: {image_name}
-标签: {tag}
-完整名称: {image_name}:{tag}
-
-是否继续？
-"""
-        if not messagebox.askyesno("确认推送", confirm_msg):
+        # 在同一个对话框中输入标签并确认
+        tag, confirmed = PushDialog(root, image_name, CONFIRM_TMPL).show()
+        if not confirmed:
             return
         
-        # 执行推送
+        # 登录和推送在后台线程中执行
         status_bar.set_status("推送镜像", is_task=True)
-        try:
-            # 先尝试登录
-            login_output = run_command("docker login")
-            if "错误" in login_output:
-                status_bar.task_complete("推送镜像", success=False)
-                messagebox.showerror("错误", "Docker登录失败，请先登录")
-                return
-                
-            output = run_command(f"docker push {image_name}:{tag}")
-            if "错误" not in output:
-                messagebox.showinfo("成功", f"镜像 {image_name}:{tag} 推送成功")
-                status_bar.task_complete("推送镜像", success=True)
-            else:
-                messagebox.showerror("错误", output)
-                status_bar.task_complete("推送镜像", success=False)
-        except Exception as e:
-            messagebox.showerror("错误", f"推送失败: {str(e)}")
-            status_bar.task_complete("推送镜像", success=False)
+        submit_task(_push_image, (image_name, tag),
+                    lambda result: _after_push(result, status_bar, image_name, tag))
             
     except Exception as e:
         messagebox.showerror("错误", f"操作失败: {str(e)}")
 
+def _push_image(image_name, tag):
+    """登录并推送镜像（在后台线程中执行），登录失败时返回 None"""
+    if not ensure_logged_in(registry_of(image_name)):
+        return None
+    return execute_command(['docker', 'push', f"{image_name}:{tag}"])
+
+def _after_push(result, status_bar, image_name, tag):
+    """推送完成后在主线程中提示结果"""
+    if result is None:
+        status_bar.task_complete("推送镜像", success=False)
+        messagebox.showerror("错误", "Docker登录失败，请先登录")
+    elif isinstance(result, str):
+        _logged_in_registries.discard(registry_of(image_name))
+        messagebox.showerror("错误", f"推送失败: {result}")
+        status_bar.task_complete("推送镜像", success=False)
+    elif result.returncode == 0:
+        messagebox.showinfo("成功", f"镜像 {image_name}:{tag} 推送成功")
+        status_bar.task_complete("推送镜像", success=True)
+    else:
+        # 凭据可能已过期或账号不对，下次推送重新登录
+        _logged_in_registries.discard(registry_of(image_name))
+        messagebox.showerror("错误", f"推送失败: {result.stderr}")
+        status_bar.task_complete("推送镜像", success=False)
+
 if __name__ == "__main__":
     args = parse_args()
     if args.cli:
@@ -1,15 +1,52 @@
 import json
 import os
+from pathlib import Path
+
+try:
+    import orjson
+    json_loads = orjson.loads
+
+    def _json_dumps(data):
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    json_loads = json.loads
+
+    def _json_dumps(data):
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+class _ConfigCache:
+    """按 (路径, 修改时间, 文件大小) 缓存配置，文件变化时才重新解析"""
+
+    def __init__(self, path):
+        self.path = path
+        self._key = None
+        self._data = None
+
+    def get(self):
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            raise FileNotFoundError("配置文件 config.json 不存在，请先创建配置文件")
+
+        key = (self.path, st.st_mtime_ns, st.st_size)
+        if key != self._key:
+            # 直接解析 UTF-8 字节，省去文本模式的解码
+            self._data = json_loads(Path(self.path).read_bytes())
+            self._key = key
+        return self._data
+
+_config_cache = _ConfigCache("config.json")
 
 def load_config():
     """加载配置文件"""
-    if not os.path.exists("config.json"):
-        raise FileNotFoundError("配置文件 config.json 不存在，请先创建配置文件")
-    
-    with open("config.json", "r", encoding='utf-8') as f:
-        return json.load(f)
+    return _config_cache.get()
 
 def save_config(config):
-    """保存配置文件"""
-    with open("config.json", "w", encoding='utf-8') as f:
-        json.dump(config, f, indent=4, ensure_ascii=False) 
\ No newline at end of file
+    """保存配置文件：先写临时文件再原子替换，写入中途出错也不会损坏原配置"""
+    tmp = Path("config.json.tmp")
+    try:
+        tmp.write_bytes(_json_dumps(config))
+        os.replace(tmp, "config.json")
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
@@ -0,0 +1,351 @@
+"""
+Docker GUI 操作工具的界面组件
+"""
+
+import codecs
+import queue
+import subprocess
+import threading
+import time
+from tkinter import font as tkfont
+from tkinter import ttk
+import tkinter as tk
+
+# 文本区域共用的字体和配色：字体对象只创建一次，所有窗口共享
+LOG_TEXT_COLORS = {'bg': "#E8F4F8", 'fg': "#2C3E50"}  # 莫兰迪蓝色系
+_log_font = None
+
+def log_font():
+    """返回共享的等宽字体，首次调用时创建（需要在主窗口创建之后）"""
+    global _log_font
+    if _log_font is None:
+        _log_font = tkfont.Font(family='Courier', size=12)
+    return _log_font
+
+class TextEditor(tk.Toplevel):
+    def __init__(self, parent, title, initial_text="", callback=None, build_callback=None):
+        super().__init__(parent)
+        self.title(title)
+        self.callback = callback
+        self.build_callback = build_callback
+        
+        # 设置窗口大小
+        self.geometry("800x600")
+        
+        # 创建文本编辑区
+        self.text_area = tk.Text(self, wrap=tk.WORD, font=log_font(), **LOG_TEXT_COLORS)
+        self.text_area.pack(expand=True, fill='both', padx=10, pady=5)
+        self.text_area.insert('1.0', initial_text)
+        
+        # 添加推荐链接
+        recommend_label = tk.Label(
+            self,
+            text="推荐在 https://github.com/expoli/docker-compose-files 获取Dockerfile模板",
+            fg="#2C3E50",
+            cursor="hand2"
+        )
+        recommend_label.pack(pady=5)
+        recommend_label.bind("<Button-1>", self.open_recommend_link)
+        
+        # 创建按钮框
+        button_frame = tk.Frame(self)
+        button_frame.pack(fill='x', padx=10, pady=5)
+        
+        # 保存按钮
+        tk.Button(button_frame, text="保存并构建",
+                 command=self.save_and_build,
+                 bg="#A4C3D2", fg="#2C3E50").pack(side=tk.RIGHT, padx=5)
+        tk.Button(button_frame, text="仅保存",
+                 command=self.save_and_close,
+                 bg="#A4C3D2", fg="#2C3E50").pack(side=tk.RIGHT, padx=5)
+        tk.Button(button_frame, text="取消",
+                 command=self.destroy,
+                 bg="#A4C3D2", fg="#2C3E50").pack(side=tk.RIGHT, padx=5)
+    
+    def open_recommend_link(self, event):
+        import webbrowser
+        webbrowser.open("https://github.com/expoli/docker-compose-files")
+    
+    def save_and_build(self):
+        if self.callback:
+            self.callback(self.text_area.get('1.0', tk.END))
+        self.destroy()
+        if self.build_callback:
+            self.build_callback()
+
+    def save_and_close(self):
+        if self.callback:
+            self.callback(self.text_area.get('1.0', tk.END))
+        self.destroy()
+
+class ProgressWindow(tk.Toplevel):
+    TICK_INTERVAL = 200  # 毫秒，手动推进进度条，避免 start(10) 每秒重绘100次
+    
+    def __init__(self, parent, title):
+        super().__init__(parent)
+        self.title(title)
+        
+        # 设置窗口大小和位置
+        self.geometry("400x150")
+        self.transient(parent)
+        self.grab_set()
+        
+        # 进度条
+        self.progress = ttk.Progressbar(self, mode='indeterminate', length=300)
+        self.progress.pack(pady=20)
+        
+        # 状态标签
+        self.status_label = tk.Label(self, text="处理中...", font=('Arial', 10))
+        self.status_label.pack(pady=10)
+        
+        self._tick_id = self.after(self.TICK_INTERVAL, self._tick)
+    
+    def _tick(self):
+        self.progress.step(5)
+        self._tick_id = self.after(self.TICK_INTERVAL, self._tick)
+    
+    def update_status(self, text):
+        self.status_label.config(text=text)
+    
+    def finish(self):
+        self.destroy()
+    
+    def destroy(self):
+        # 用户可能在任务进行中直接关闭窗口，需在此取消定时器
+        if self._tick_id is not None:
+            self.after_cancel(self._tick_id)
+            self._tick_id = None
+        super().destroy()
+
+class PushDialog(tk.Toplevel):
+    """推送镜像对话框：在一个窗口中输入标签并确认推送信息"""
+    
+    def __init__(self, parent, image_name, message_tmpl, initial_tag="latest"):
+        super().__init__(parent)
+        self.title("推送镜像")
+        self.transient(parent)
+        self.resizable(False, False)
+        self.image_name = image_name
+        self.message_tmpl = message_tmpl
+        self.result = (None, False)
+        
+        # 标签输入
+        tk.Label(self, text="请输入标签名称:").pack(padx=10, pady=(10, 0), anchor='w')
+        self.tag_var = tk.StringVar(value=initial_tag)
+        self.tag_entry = tk.Entry(self, textvariable=self.tag_var, width=40)
+        self.tag_entry.pack(padx=10, pady=5, fill='x')
+        self.tag_entry.bind("<KeyRelease>", self.update_message)
+        
+        # 确认信息，随标签输入更新
+        self.message_label = tk.Label(self, justify=tk.LEFT, fg="#2C3E50")
+        self.message_label.pack(padx=10, pady=5, anchor='w')
+        self.update_message()
+        
+        # 按钮框
+        button_frame = tk.Frame(self)
+        button_frame.pack(fill='x', padx=10, pady=10)
+        tk.Button(button_frame, text="取消",
+                 command=self.cancel,
+                 bg="#A4C3D2", fg="#2C3E50").pack(side=tk.RIGHT, padx=5)
+        tk.Button(button_frame, text="推送",
+                 command=self.confirm,
+                 bg="#A4C3D2", fg="#2C3E50").pack(side=tk.RIGHT, padx=5)
+        
+        self.bind("<Return>", lambda e: self.confirm())
+        self.bind("<Escape>", lambda e: self.cancel())
+        self.protocol("WM_DELETE_WINDOW", self.cancel)
+    
+    def update_message(self, event=None):
+        tag = self.tag_var.get().strip()
+        self.message_label.config(text=self.message_tmpl.format(name=self.image_name, tag=tag))
+    
+    def confirm(self):
+        tag = self.tag_var.get().strip()
+        if not tag:
+            self.bell()
+            return
+        self.result = (tag, True)
+        self.destroy()
+    
+    def cancel(self):
+        self.result = (None, False)
+        self.destroy()
+    
+    def show(self):
+        """模态显示对话框，返回 (标签, 是否确认)"""
+        self.tag_entry.focus_set()
+        self.tag_entry.select_range(0, tk.END)
+        self.grab_set()
+        self.wait_window()
+        return self.result
+
+class LogWindow(tk.Toplevel):
+    """实时跟踪容器日志，只加载最近的日志并限制总行数"""
+    TAIL_LINES = 500
+    MAX_LINES = 10000
+    DRAIN_INTERVAL = 100  # 毫秒
+    
+    def __init__(self, parent, container_name):
+        super().__init__(parent)
+        self.title(f"容器日志 - {container_name}")
+        self.geometry("1000x600")
+        self.protocol("WM_DELETE_WINDOW", self.close)
+        
+        # 按钮框
+        button_frame = tk.Frame(self)
+        button_frame.pack(side=tk.BOTTOM, fill='x', padx=10, pady=5)
+        self.stop_button = tk.Button(button_frame, text="停止跟踪", command=self.stop,
+                                     bg="#A4C3D2", fg="#2C3E50")
+        self.stop_button.pack(side=tk.RIGHT, padx=5)
+        
+        self.log_text = tk.Text(self, height=30, width=100, font=log_font())
+        log_scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.log_text.yview)
+        self.log_text.configure(yscrollcommand=log_scrollbar.set)
+        
+        self.log_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10, pady=10)
+        log_scrollbar.pack(side=tk.RIGHT, fill=tk.Y, pady=10)
+        
+        self._queue = queue.Queue()
+        self._decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        self._drain_id = None
+        try:
+            self._proc = subprocess.Popen(
+                ['docker', 'logs', '-f', f'--tail={self.TAIL_LINES}', container_name],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT
+            )
+        except OSError as e:
+            self._proc = None
+            self.log_text.insert(tk.END, f"获取日志失败: {str(e)}")
+            self.stop_button.config(state=tk.DISABLED)
+            return
+        
+        threading.Thread(target=self._read, daemon=True).start()
+        self._drain_id = self.after(self.DRAIN_INTERVAL, self._drain)
+    
+    def _read(self):
+        """读取线程：把日志输出按字节块放入队列，结束时放入 None"""
+        for chunk in iter(lambda: self._proc.stdout.read1(65536), b''):
+            self._queue.put(chunk)
+        self._queue.put(None)
+    
+    def _drain(self):
+        """定时把队列中的日志追加到文本框"""
+        chunks = []
+        finished = False
+        while True:
+            try:
+                chunk = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if chunk is None:
+                finished = True
+                break
+            chunks.append(chunk)
+        
+        if chunks:
+            # 仅在已滚动到底部时自动跟随
+            at_bottom = self.log_text.yview()[1] >= 1.0
+            # 只在写入文本框时解码，增量解码器可处理被切开的多字节字符
+            self.log_text.insert(tk.END, self._decoder.decode(b''.join(chunks)))
+            line_count = int(self.log_text.index('end-1c').split('.')[0])
+            if line_count > self.MAX_LINES:
+                self.log_text.delete('1.0', f'{line_count - self.MAX_LINES + 1}.0')
+            if at_bottom:
+                self.log_text.see(tk.END)
+        
+        if finished:
+            self._drain_id = None
+            self.stop_button.config(state=tk.DISABLED)
+        else:
+            self._drain_id = self.after(self.DRAIN_INTERVAL, self._drain)
+    
+    def stop(self):
+        """停止跟踪日志，已显示的内容保留"""
+        if self._proc and self._proc.poll() is None:
+            self._proc.terminate()
+    
+    def close(self):
+        self.destroy()
+    
+    def destroy(self):
+        # 主窗口关闭时也会调用，保证 docker logs -f 子进程随窗口结束
+        self.stop()
+        if self._drain_id is not None:
+            self.after_cancel(self._drain_id)
+            self._drain_id = None
+        super().destroy()
+
+class StatusBar(tk.Frame):
+    TASK_TIMEOUT = 60 * 1000  # 1分钟超时
+    
+    def __init__(self, master):
+        super().__init__(master)
+        self.label = tk.Label(self, bd=1, relief=tk.SUNKEN, anchor=tk.CENTER,
+                            bg="#A4C3D2", fg="#2C3E50",
+                            font=('Arial', 10))
+        self.label.pack(fill=tk.X)
+        # 每个进行中的任务只有一个超时定时器：{任务名: after id}
+        self._timeout_ids = {}
+        # 合并短时间内的多次更新，空闲时只显示最后一条
+        self._pending_text = None
+        self._flush_id = None
+        self._last_text = None
+        # 时间字符串每秒只格式化一次
+        self._clock_second = None
+        self._clock_text = ""
+        
+    def set_status(self, text, is_task=False):
+        if is_task:
+            self._show(f"{text}任务正在进行中.....")
+            self._cancel_timeout(text)
+            self._timeout_ids[text] = self.after(self.TASK_TIMEOUT, self.check_timeout, text)
+        else:
+            current_time = self._clock()
+            self._show(f"{text} - {current_time}")
+    
+    def check_timeout(self, task_name):
+        if self._timeout_ids.pop(task_name, None) is not None:
+            self.task_complete(task_name, success=False, message="任务超时")
+    
+    def _cancel_timeout(self, task_name):
+        after_id = self._timeout_ids.pop(task_name, None)
+        if after_id is not None:
+            self.after_cancel(after_id)
+    
+    def task_complete(self, task_name, success=True, message=None):
+        self._cancel_timeout(task_name)
+        current_time = self._clock()
+        status = "成功" if success else "失败"
+        status_text = f"{task_name}任务{status}"
+        if message:
+            status_text += f": {message}"
+        status_text += f" - {current_time}"
+        self._show(status_text)
+    
+    def _show(self, text):
+        self._pending_text = text
+        if self._flush_id is None:
+            self._flush_id = self.after_idle(self._flush)
+    
+    def _flush(self):
+        self._flush_id = None
+        if self._pending_text == self._last_text:
+            return
+        self._last_text = self._pending_text
+        self.label.config(text=self._pending_text)
+    
+    def _clock(self):
+        now = int(time.time())
+        if now != self._clock_second:
+            self._clock_second = now
+            self._clock_text = time.strftime("%H:%M:%S", time.localtime(now))
+        return self._clock_text
+    
+    def destroy(self):
+        for task_name in list(self._timeout_ids):
+            self._cancel_timeout(task_name)
+        if self._flush_id is not None:
+            self.after_cancel(self._flush_id)
+            self._flush_id = None
+        super().destroy()